@@ -76,10 +76,14 @@ class BaseEntity(dict, metaclass=ABCMeta):
 
     function = ...
 
+    #: The cached BEL string. Declared on the class so nodes pickled before it was cached can still be hashed.
+    _bel = None
+
     def __init__(self) -> None:
         """Build a PyBEL node."""
         super().__init__(**{FUNCTION: self.function})
         self._md5 = None
+        self._bel = None
 
     @property
     def _bel_function(self) -> str:
@@ -89,18 +93,25 @@ class BaseEntity(dict, metaclass=ABCMeta):
     def as_bel(self, use_identifiers: bool = True) -> str:
         """Return this entity as a BEL string."""
 
+    @property
+    def _canonical_bel(self) -> str:
+        """Get the BEL string used to hash and compare this node, calculating it only once."""
+        if self._bel is None:
+            self._bel = self.as_bel()
+        return self._bel
+
     @property
     def md5(self) -> str:
         """Get the MD5 hash of this node."""
         if self._md5 is None:
-            self._md5 = hashlib.md5(self.as_bel().encode('utf8')).hexdigest()  # noqa: S303
+            self._md5 = hashlib.md5(self._canonical_bel.encode('utf8')).hexdigest()  # noqa: S303
         return self._md5
 
     def __hash__(self):  # noqa: D105
-        return hash(self.as_bel())
+        return hash(self._canonical_bel)
 
     def __eq__(self, other):
-        return isinstance(other, BaseEntity) and self.as_bel() == other.as_bel()
+        return isinstance(other, BaseEntity) and self._canonical_bel == other._canonical_bel
 
     def __repr__(self):
         return '<BEL {bel}>'.format(bel=self.as_bel(use_identifiers=True))
@@ -7,6 +7,7 @@ export to other programs. Notably, a *de facto* interchange using Resource Descr
 ability of other existing software is excluded due the immaturity of the BEL to RDF mapping.
 """
 
+from .csr import to_csr
 from .cx import from_cx, from_cx_file, from_cx_gz, from_cx_jsons, to_cx, to_cx_file, to_cx_gz, to_cx_jsons
 from .extras import to_csv, to_gsea, to_sif
 from .gpickle import from_bytes, from_pickle, to_bytes, to_pickle
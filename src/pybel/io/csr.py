@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+
+"""Export a BEL graph as a compressed sparse row (CSR) adjacency structure.
+
+Each node in the graph gets a consecutive integer index. The targets of the outgoing edges of the node with index
+``i`` are ``indices[indptr[i]:indptr[i + 1]]``. The attributes of the edges are stored in a
+:class:`pandas.DataFrame` whose rows line up with ``indices``. This makes it possible to run bulk analyses with
+vectorized :mod:`numpy` and :mod:`pandas` operations instead of iterating over the nested dictionaries of the graph.
+
+.. code-block:: python
+
+    import pybel
+    from pybel.constants import INCREASES
+    graph = pybel.from_bel_script('...')
+    csr = pybel.to_csr(graph)
+    increases = csr.edges[csr.edges['relation'] == INCREASES]
+"""
+
+from typing import List, NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from ..constants import CITATION, CITATION_DB, CITATION_IDENTIFIER, EVIDENCE, RELATION
+from ..dsl import BaseEntity
+from ..struct import BELGraph
+
+__all__ = [
+    'CSRGraph',
+    'to_csr',
+]
+
+#: The columns of :data:`CSRGraph.edges`
+EDGE_COLUMNS = ['source', 'target', 'key', 'relation', 'evidence', 'citation_db', 'citation_identifier']
+
+CSRGraph = NamedTuple('CSRGraph', [
+    ('nodes', List[BaseEntity]),
+    ('indptr', np.ndarray),
+    ('indices', np.ndarray),
+    ('edges', pd.DataFrame),
+])
+
+
+def to_csr(graph: BELGraph) -> CSRGraph:
+    """Convert a BEL graph to a compressed sparse row adjacency structure.
+
+    :param graph: A BEL graph
+    :return: A named tuple of the list of nodes (whose positions are their indices), the row pointer array,
+     the target index array, and a dataframe with one row per edge whose columns are given by :data:`EDGE_COLUMNS`
+    """
+    nodes = list(graph)
+    node_to_index = {node: index for index, node in enumerate(nodes)}
+    adjacency = dict(graph.adjacency())
+
+    indptr = np.zeros(len(nodes) + 1, dtype=np.int32)
+    rows = []
+
+    for source, u in enumerate(nodes):
+        for v, keyed_data in adjacency[u].items():
+            target = node_to_index[v]
+            for key, data in keyed_data.items():
+                citation = data.get(CITATION)
+                rows.append((
+                    source,
+                    target,
+                    key,
+                    data.get(RELATION),
+                    data.get(EVIDENCE),
+                    citation and citation.get(CITATION_DB),
+                    citation and citation.get(CITATION_IDENTIFIER),
+                ))
+        indptr[source + 1] = len(rows)
+
+    edges = pd.DataFrame(rows, columns=EDGE_COLUMNS)
+    indices = edges['target'].to_numpy(dtype=np.int32)
+
+    return CSRGraph(nodes=nodes, indptr=indptr, indices=indices, edges=edges)
@@ -5,7 +5,8 @@
 import logging
 import re
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from itertools import zip_longest
 from typing import Dict, Iterable, List, Optional, Set, Tuple, Union
 
@@ -25,46 +26,51 @@ logger = logging.getLogger(__name__)
 
 EUTILS_URL_FMT = "http://eutils.ncbi.nlm.nih.gov/entrez/eutils/esummary.fcgi?db=pubmed&retmode=json&id={}"
 
-re1 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}$')
-re2 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3}$')
-re3 = re.compile(r'^[12][0-9]{3}$')
-re4 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3}-[a-zA-Z]{3}$')
-re5 = re.compile(r'^([12][0-9]{3}) (Spring|Fall|Winter|Summer)$')
-re6 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}-(\d{1,2})$')
-re7 = re.compile(r'^[12][0-9]{3} [a-zA-Z]{3} \d{1,2}-([a-zA-Z]{3} \d{1,2})$')
+#: Matches all of the date formats that PubMed uses. Only the first month and day of a range are captured.
+_date_re = re.compile(
+    r'^(?P<year>[12][0-9]{3})'
+    r'(?: (?:(?P<season>Spring|Summer|Fall|Winter)'
+    r'|(?P<month>[a-zA-Z]{3})(?:-[a-zA-Z]{3}| (?P<day>\d{1,2})(?:-(?:[a-zA-Z]{3} )?\d{1,2})?)?))?$',
+)
 
 season_map = {'Spring': '03', 'Summer': '06', 'Fall': '09', 'Winter': '12'}
 
+_month_map = {
+    month: i
+    for i, month in enumerate(
+        ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'),
+        start=1,
+    )
+}
 
-def sanitize_date(publication_date: str) -> str:
-    """Sanitize lots of different date strings into ISO-8601."""
-    if re1.search(publication_date):
-        return datetime.strptime(publication_date, '%Y %b %d').strftime('%Y-%m-%d')
-
-    if re2.search(publication_date):
-        return datetime.strptime(publication_date, '%Y %b').strftime('%Y-%m-01')
 
-    if re3.search(publication_date):
-        return publication_date + "-01-01"
+def sanitize_date(publication_date: str) -> Optional[str]:
+    """Sanitize lots of different date strings into ISO-8601.
 
-    if re4.search(publication_date):
-        return datetime.strptime(publication_date[:-4], '%Y %b').strftime('%Y-%m-01')
+    Handles ``YYYY``, ``YYYY Mon``, ``YYYY Mon DD``, ``YYYY Season``, and the ranges ``YYYY Mon-Mon``,
+    ``YYYY Mon DD-DD``, and ``YYYY Mon DD-Mon DD``, for which the beginning of the range is used.
+    Returns None if the date can't be parsed.
+    """
+    match = _date_re.match(publication_date)
+    if match is None:
+        return
 
-    s = re5.search(publication_date)
+    year, season, month, day = match.group('year', 'season', 'month', 'day')
 
-    if s:
-        year, season = s.groups()
+    if season is not None:
         return '{}-{}-01'.format(year, season_map[season])
 
-    s = re6.search(publication_date)
+    if month is None:
+        return year + '-01-01'
 
-    if s:
-        return datetime.strptime(publication_date, '%Y %b %d-{}'.format(s.groups()[0])).strftime('%Y-%m-%d')
+    month = _month_map.get(month.lower())
+    if month is None:
+        return
 
-    s = re7.search(publication_date)
-
-    if s:
-        return datetime.strptime(publication_date, '%Y %b %d-{}'.format(s.groups()[0])).strftime('%Y-%m-%d')
+    try:
+        return date(int(year), month, int(day) if day is not None else 1).isoformat()
+    except ValueError:  # the day is out of range for the month
+        return
 
 
 def grouper(n, iterable, fillvalue=None):
@@ -81,10 +87,14 @@ def clean_pubmed_identifiers(pmids: Iterable[str]) -> List[str]:
     return sorted({str(pmid).strip() for pmid in pmids})
 
 
-def get_pubmed_citation_response(pubmed_identifiers: Iterable[str]):
+def get_pubmed_citation_response(
+    pubmed_identifiers: Iterable[str],
+    session: Optional[requests.Session] = None,
+):
     """Get the response from PubMed E-Utils for a given list of PubMed identifiers.
 
     :param pubmed_identifiers:
+    :param session: An optional session, so the connection to NCBI can be reused between queries
     :rtype: dict
     """
     pubmed_identifiers = list(pubmed_identifiers)
@@ -95,10 +105,20 @@ def get_pubmed_citation_response(pubmed_identifiers: Iterable[str]):
             if pubmed_identifier
         ),
     )
-    response = requests.get(url)
+    response = (requests if session is None else session).get(url)
     return response.json()
 
 
+def _sleep_and_get_pubmed_citation_response(
+    pubmed_identifiers: Iterable[str],
+    session: requests.Session,
+    sleep_time: float,
+):
+    """Wait before querying PubMed E-Utils so consecutive queries don't hit the rate limit."""
+    time.sleep(sleep_time)
+    return get_pubmed_citation_response(pubmed_identifiers, session=session)
+
+
 def enrich_citation_model(manager, citation, p) -> bool:
     """Enrich a citation model with the information from PubMed.
 
@@ -119,9 +139,12 @@ def enrich_citation_model(manager, citation, p) -> bool:
     citation.last = manager.get_or_create_author(p['lastauthor'])
 
     if 'authors' in p:
+        # Check membership against a set since some papers have hundreds of authors
+        author_models = set(citation.authors)
         for author in p['authors']:
             author_model = manager.get_or_create_author(author['name'])
-            if author_model not in citation.authors:
+            if author_model not in author_models:
+                author_models.add(author_model)
                 citation.authors.append(author_model)
 
     publication_date = p['pubdate']
@@ -180,37 +203,67 @@ def get_citations_by_pmids(
     errors = set()
     t = time.time()
 
-    for pmid_group_index, pmid_list in enumerate(grouper(group_size, unenriched_pmids), start=1):
-        pmid_list = list(pmid_list)
-        logger.info('Getting group %d having %d PubMed identifiers', pmid_group_index, len(pmid_list))
+    pmid_lists = [list(pmid_list) for pmid_list in grouper(group_size, unenriched_pmids)]
 
-        response = get_pubmed_citation_response(pmid_list)
-        response_pmids = response['result']['uids']
+    # The next group is downloaded in the background while the current one is written to the database. Only one
+    # worker is used so the queries still go out one at a time and are spaced out by the sleep time.
+    with requests.Session() as session, ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(get_pubmed_citation_response, pmid_lists[0], session=session)
 
-        for pmid in response_pmids:
-            p = response['result'][pmid]
-            citation = unenriched_pmids[pmid]
+        for pmid_group_index, pmid_list in enumerate(pmid_lists, start=1):
+            logger.info('Getting group %d having %d PubMed identifiers', pmid_group_index, len(pmid_list))
+            response = future.result()
 
-            successful_enrichment = enrich_citation_model(manager, citation, p)
+            if pmid_group_index < len(pmid_lists):
+                future = executor.submit(
+                    _sleep_and_get_pubmed_citation_response,
+                    pmid_lists[pmid_group_index],
+                    session=session,
+                    sleep_time=sleep_time,
+                )
 
-            if not successful_enrichment:
-                logger.warning("Error downloading PubMed identifier: %s", pmid)
-                errors.add(pmid)
-                continue
+            _enrich_citations_from_response(manager, response, unenriched_pmids, result, errors)
 
-            result[pmid] = citation.to_json()
-            manager.session.add(citation)
-
-        manager.session.commit()  # commit in groups
-
-        # Don't want to hit that rate limit
-        time.sleep(sleep_time)
+            # PubMed leaves identifiers that it doesn't know about out of the response entirely
+            errors.update(
+                pmid
+                for pmid in pmid_list
+                if pmid is not None and pmid not in result
+            )
 
     logger.info('retrieved %d PubMed identifiers in %.02f seconds', len(unenriched_pmids), time.time() - t)
 
     return result, errors
 
 
+def _enrich_citations_from_response(manager, response, unenriched_pmids, result, errors) -> None:
+    """Enrich the citation models for a PubMed E-Utils response then commit them.
+
+    :type manager: pybel.manager.Manager
+    :param dict response: The response from :func:`get_pubmed_citation_response`
+    :param dict[str,Citation] unenriched_pmids: A dictionary from PubMed identifiers to citation models
+    :param dict[str,dict] result: A dictionary from PubMed identifiers to their data that gets updated in-place
+    :param set[str] errors: A set of erroneous PubMed identifiers that gets updated in-place
+    """
+    response_pmids = response['result']['uids']
+
+    for pmid in response_pmids:
+        p = response['result'][pmid]
+        citation = unenriched_pmids[pmid]
+
+        successful_enrichment = enrich_citation_model(manager, citation, p)
+
+        if not successful_enrichment:
+            logger.warning("Error downloading PubMed identifier: %s", pmid)
+            errors.add(pmid)
+            continue
+
+        result[pmid] = citation.to_json()
+        manager.session.add(citation)
+
+    manager.session.commit()  # commit in groups
+
+
 def enrich_pubmed_citations(
     manager,
     graph,
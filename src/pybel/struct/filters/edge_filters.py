@@ -11,9 +11,9 @@ A general use for an edge predicate is to use the built-in :func:`filter` in cod
 :code:`filter(your_edge_predicate, graph.edges(keys=True, data=True))`
 """
 
-from typing import Iterable
+from typing import Iterable, List
 
-from .typing import EdgeIterator, EdgePredicate, EdgePredicates
+from .typing import EdgeIterator, EdgePredicate, EdgePredicates, EdgeTuple
 from ..graph import BELGraph
 from ...dsl import BaseEntity
 
@@ -21,6 +21,7 @@ __all__ = [
     'invert_edge_predicate',
     'and_edge_predicates',
     'filter_edges',
+    'get_edges',
     'count_passed_edge_filter',
 ]
 
@@ -64,12 +65,34 @@ def filter_edges(graph: BELGraph, edge_predicates: EdgePredicates) -> EdgeIterat
 
     :return: An iterable of edges that pass all predicates
     """
+    # If an empty list of predicates is given, skip calling an always-true predicate on every edge
+    if isinstance(edge_predicates, Iterable) and not edge_predicates:
+        yield from graph.edges(keys=True)
+        return
+
     compound_edge_predicate = and_edge_predicates(edge_predicates=edge_predicates)
     for u, v, k in graph.edges(keys=True):
         if compound_edge_predicate(graph, u, v, k):
             yield u, v, k
 
 
+def get_edges(graph: BELGraph, edge_predicates: EdgePredicates) -> List[EdgeTuple]:
+    """Get a list of the edges that pass all predicates.
+
+    The list is built directly, which is faster than consuming :func:`filter_edges` when all the edges are
+    needed at once, like before removing them from the graph. Use :func:`filter_edges` to stream them instead.
+    """
+    if isinstance(edge_predicates, Iterable) and not edge_predicates:
+        return list(graph.edges(keys=True))
+
+    compound_edge_predicate = and_edge_predicates(edge_predicates=edge_predicates)
+    return [
+        (u, v, k)
+        for u, v, k in graph.edges(keys=True)
+        if compound_edge_predicate(graph, u, v, k)
+    ]
+
+
 def count_passed_edge_filter(graph: BELGraph, edge_predicates: EdgePredicates) -> int:
     """Return the number of edges passing a given set of predicates."""
     return sum(
@@ -104,7 +104,7 @@ def build_upstream_edge_predicate(nodes: Iterable[BaseEntity]) -> EdgePredicate:
 
     def upstream_filter(graph: BELGraph, u: BaseEntity, v: BaseEntity, k: str) -> bool:
         """Pass for relations for which one of the given nodes is the object."""
-        return v in nodes and graph[u][v][k][RELATION] in CAUSAL_RELATIONS
+        return v in nodes and graph.edges[u, v, k][RELATION] in CAUSAL_RELATIONS
 
     return upstream_filter
 
@@ -115,7 +115,7 @@ def build_downstream_edge_predicate(nodes: Iterable[BaseEntity]) -> EdgePredicat
 
     def downstream_filter(graph: BELGraph, u: BaseEntity, v: BaseEntity, k: str) -> bool:
         """Pass for relations for which one of the given nodes is the subject."""
-        return u in nodes and graph[u][v][k][RELATION] in CAUSAL_RELATIONS
+        return u in nodes and graph.edges[u, v, k][RELATION] in CAUSAL_RELATIONS
 
     return downstream_filter
 
@@ -50,7 +50,7 @@ def edge_predicate(func: DictEdgePredicate) -> EdgePredicate:  # noqa: D202
 
         if isinstance(x, BELGraph):
             u, v, k = args[1:4]
-            return func(x[u][v][k])
+            return func(x.edges[u, v, k])
 
         return func(*args)
 
@@ -70,6 +70,11 @@ def concatenate_node_predicates(node_predicates: NodePredicates) -> NodePredicat
 
 def filter_nodes(graph: BELGraph, node_predicates: NodePredicates) -> Iterable[BaseEntity]:
     """Apply a set of predicates to the nodes iterator of a BEL graph."""
+    # If an empty list of predicates is given, skip calling an always-true predicate on every node
+    if isinstance(node_predicates, Iterable) and not node_predicates:
+        yield from graph
+        return
+
     concatenated_predicate = concatenate_node_predicates(node_predicates=node_predicates)
     for node in graph:
         if concatenated_predicate(graph, node):
@@ -37,6 +37,8 @@ __all__ = [
 
 logger = logging.getLogger(__name__)
 
+_PYBEL_VERSION = get_version()
+
 AnnotationsDict = Mapping[str, Mapping[str, bool]]
 AnnotationsHint = Union[Mapping[str, str], Mapping[str, Set[str]], AnnotationsDict]
 WarningTuple = Tuple[Optional[str], BELParserWarning, EdgeData]
@@ -73,15 +75,16 @@ class BELGraph(nx.MultiDiGraph):
 
         self._warnings = []
 
-        self.graph[GRAPH_PYBEL_VERSION] = get_version()
-        self.graph[GRAPH_METADATA] = {}
+        graph = self.graph
+        graph[GRAPH_PYBEL_VERSION] = _PYBEL_VERSION
+        graph[GRAPH_METADATA] = {}
 
-        self.graph[GRAPH_NAMESPACE_URL] = {}
-        self.graph[GRAPH_NAMESPACE_PATTERN] = {}
+        graph[GRAPH_NAMESPACE_URL] = {}
+        graph[GRAPH_NAMESPACE_PATTERN] = {}
 
-        self.graph[GRAPH_ANNOTATION_URL] = {}
-        self.graph[GRAPH_ANNOTATION_PATTERN] = {}
-        self.graph[GRAPH_ANNOTATION_LIST] = defaultdict(set)
+        graph[GRAPH_ANNOTATION_URL] = {}
+        graph[GRAPH_ANNOTATION_PATTERN] = {}
+        graph[GRAPH_ANNOTATION_LIST] = defaultdict(set)
 
         if name:
             self.name = name
@@ -338,7 +341,7 @@ class BELGraph(nx.MultiDiGraph):
         :param exception: The exception that occurred
         :param context: The context from the parser when the exception occurred
         """
-        self.warnings.append((
+        self._warnings.append((
             self.path,
             exception,
             {} if context is None else context,
@@ -370,6 +373,18 @@ class BELGraph(nx.MultiDiGraph):
         attr = {RELATION: relation}
         return self._help_add_edge(u, v, attr)
 
+    def add_unqualified_edges(self, triples: Iterable[Tuple[BaseEntity, BaseEntity, str]]) -> List[str]:
+        """Add several unique edges that have no annotations.
+
+        :param triples: An iterable of (source node, target node, relation) triples
+        :return: The keys for the edges, in the same order as the given triples
+        """
+        help_add_edge = self._help_add_edge
+        return [
+            help_add_edge(u, v, {RELATION: relation})
+            for u, v, relation in triples
+        ]
+
     def add_transcription(self, gene: Gene, rna: Union[Rna, MicroRna]) -> str:
         """Add a transcription relation from a gene to an RNA or miRNA node.
 
@@ -631,7 +646,7 @@ class BELGraph(nx.MultiDiGraph):
     def _has_edge_attr(self, u: BaseEntity, v: BaseEntity, key: str, attr: Hashable) -> bool:
         assert isinstance(u, BaseEntity)
         assert isinstance(v, BaseEntity)
-        return attr in self[u][v][key]
+        return attr in self.edges[u, v, key]
 
     def has_edge_citation(self, u: BaseEntity, v: BaseEntity, key: str) -> bool:
         """Check if the given edge has a citation."""
@@ -642,7 +657,7 @@ class BELGraph(nx.MultiDiGraph):
         return self._has_edge_attr(u, v, key, EVIDENCE)
 
     def _get_edge_attr(self, u: BaseEntity, v: BaseEntity, key: str, attr: str):
-        return self[u][v][key].get(attr)
+        return self.edges[u, v, key].get(attr)
 
     def get_edge_citation(self, u: BaseEntity, v: BaseEntity, key: str) -> Optional[CitationDict]:
         """Get the citation for a given edge."""
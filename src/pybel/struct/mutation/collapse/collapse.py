@@ -5,7 +5,7 @@
 import itertools as itt
 from typing import Mapping, Set
 
-from ...filters import filter_edges
+from ...filters import get_edges
 from ...filters.edge_predicate_builders import build_relation_predicate
 from ...pipeline import in_place_transformation
 from ....constants import HAS_VARIANT
@@ -92,7 +92,7 @@ def collapse_all_variants(graph) -> None:
     """
     has_variant_predicate = build_relation_predicate(HAS_VARIANT)
 
-    edges = list(filter_edges(graph, has_variant_predicate))
+    edges = get_edges(graph, has_variant_predicate)
 
     for u, v, _ in edges:
         collapse_pair(graph, survivor=u, victim=v)
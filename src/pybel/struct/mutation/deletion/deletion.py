@@ -2,7 +2,7 @@
 
 """Functions for deleting nodes and edges in networks."""
 
-from ...filters.edge_filters import filter_edges
+from ...filters.edge_filters import get_edges
 from ...filters.edge_predicates import is_associative_relation, not_causal_relation
 from ...filters.node_filters import filter_nodes
 from ...filters.node_predicate_builders import function_inclusion_filter_builder
@@ -30,7 +30,7 @@ def remove_filtered_edges(graph, edge_predicates=None):
     :type edge_predicates: None or ((pybel.BELGraph, tuple, tuple, int) -> bool) or iter[(pybel.BELGraph, tuple, tuple, int) -> bool]]
     :return:
     """
-    edges = list(filter_edges(graph, edge_predicates=edge_predicates))
+    edges = get_edges(graph, edge_predicates=edge_predicates)
     graph.remove_edges_from(edges)
 
 
@@ -55,16 +55,18 @@ def left_full_join(g, h) -> None:
     >>> h = pybel.from_path('...')
     >>> left_full_join(g, h)
     """
-    g.add_nodes_from(
-        (node, data)
-        for node, data in h.nodes(data=True)
-        if node not in g
-    )
-    g.add_edges_from(
-        (u, v, key, data)
-        for u, v, key, data in h.edges(keys=True, data=True)
-        if u not in g or v not in g[u] or key not in g[u][v]
-    )
+    add_node, add_edge, has_edge = g.add_node, g.add_edge, g.has_edge
+
+    # Add the nodes first so they keep the same order and data as in h
+    for node, data in h.nodes(data=True):
+        if node not in g:
+            add_node(node, **data)
+
+    for u, neighbors in h.adjacency():
+        for v, keyed_data in neighbors.items():
+            for key, data in keyed_data.items():
+                if not has_edge(u, v, key):
+                    add_edge(u, v, key=key, **data)
 
     update_metadata(h, g)
     update_node_helper(h, g)
@@ -34,6 +34,14 @@ def update_node_helper(source: nx.Graph, target: nx.Graph) -> None:
     :param source: The universe of all knowledge
     :param target: The target BEL graph
     """
-    for node in target:
-        if node in source:
-            target.nodes[node].update(source.nodes[node])
+    source_nodes, target_nodes = source.nodes, target.nodes
+
+    # Only nodes in both graphs get updated, so walk whichever graph is smaller. This is usually the target.
+    if len(source) < len(target):
+        for node, data in source_nodes(data=True):
+            if data and node in target:
+                target_nodes[node].update(data)
+    else:
+        for node in target:
+            if node in source:
+                target_nodes[node].update(source_nodes[node])
@@ -2,6 +2,7 @@
 
 """Tests for the internal DSL."""
 
+import pickle
 import unittest
 
 from pybel import BELGraph
@@ -87,6 +88,36 @@ class TestDSL(unittest.TestCase):
         node = Abundance(namespace=namespace, name=name)
         self.assertEqual(hash(node), hash(node.as_bel()))
 
+    def test_equality_after_copy(self):
+        """Test that nodes with the same BEL compare and hash equally, even after being copied."""
+        namespace, name = n(), n()
+        node = ComplexAbundance([Protein(namespace=namespace, name=name), Abundance(namespace=namespace, name=name)])
+        self.assertEqual(hash(node), hash(node.as_bel()))
+
+        other = ComplexAbundance([Abundance(namespace=namespace, name=name), Protein(namespace=namespace, name=name)])
+        self.assertEqual(node, other)
+        self.assertEqual(hash(node), hash(other))
+
+        node_copy = pickle.loads(pickle.dumps(node))
+        self.assertEqual(node, node_copy)
+        self.assertIn(node_copy, {other})
+
+    def test_unpickle_without_cached_bel(self):
+        """Test that nodes pickled before the BEL string was cached can still be loaded into a graph."""
+        namespace, name = n(), n()
+        node = Protein(namespace=namespace, name=name)
+        other = Protein(namespace=namespace, name=n())
+        graph = BELGraph()
+        graph.add_increases(node, other, citation=n(), evidence=n())
+
+        for entity in graph:
+            entity.__dict__.pop('_bel', None)
+            self.assertNotIn('_bel', entity.__dict__)
+
+        graph_copy = pickle.loads(pickle.dumps(graph))
+        self.assertIn(Protein(namespace=namespace, name=name), graph_copy)
+        self.assertEqual(1, graph_copy.number_of_edges())
+
     def test_empty_complex(self):
         """Test that an empty complex causes a failure."""
         with self.assertRaises(ValueError):
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+
+"""Tests for the CSR exporter."""
+
+import unittest
+
+from pybel import BELGraph, to_csr
+from pybel.constants import CITATION_TYPE_PUBMED, DECREASES, INCREASES, PART_OF
+from pybel.dsl import Protein
+from pybel.testing.utils import n
+
+a, b, c, d = (Protein('HGNC', name) for name in 'ABCD')
+
+
+class TestCSR(unittest.TestCase):
+    """Tests for exporting to CSR."""
+
+    def test_to_csr(self):
+        """Test the row pointers, indices, and edge data line up."""
+        graph = BELGraph()
+        graph.add_increases(a, b, citation='1', evidence=n())
+        graph.add_decreases(a, c, citation='2', evidence=n())
+        graph.add_increases(c, b, citation='3', evidence=n())
+        graph.add_part_of(b, d)
+        graph.add_node(Protein('HGNC', 'E'))
+
+        csr = to_csr(graph)
+
+        self.assertEqual(list(graph), csr.nodes)
+        self.assertEqual(graph.number_of_nodes() + 1, len(csr.indptr))
+        self.assertEqual(graph.number_of_edges(), len(csr.indices))
+        self.assertEqual(graph.number_of_edges(), len(csr.edges.index))
+
+        edges = set()
+        for source, u in enumerate(csr.nodes):
+            for position in range(csr.indptr[source], csr.indptr[source + 1]):
+                v = csr.nodes[csr.indices[position]]
+                row = csr.edges.iloc[position]
+                self.assertEqual(source, row['source'])
+                self.assertIn(row['key'], graph[u][v])
+                edges.add((u, v, row['relation']))
+
+        self.assertEqual({(a, b, INCREASES), (a, c, DECREASES), (c, b, INCREASES), (b, d, PART_OF)}, edges)
+
+        increases = csr.edges[csr.edges['relation'] == INCREASES]
+        self.assertEqual({'1', '3'}, set(increases['citation_identifier']))
+        self.assertEqual({CITATION_TYPE_PUBMED}, set(increases['citation_db']))
+
+    def test_empty(self):
+        """Test converting an empty graph."""
+        csr = to_csr(BELGraph())
+        self.assertEqual([], csr.nodes)
+        self.assertEqual([0], list(csr.indptr))
+        self.assertEqual(0, len(csr.indices))
@@ -5,12 +5,14 @@
 import os
 import time
 import unittest
+from unittest import mock
 
 from pybel import BELGraph
 from pybel.constants import (
     CITATION, CITATION_AUTHORS, CITATION_DATE, CITATION_JOURNAL, CITATION_TYPE_PUBMED,
 )
 from pybel.dsl import Protein
+from pybel.manager import Manager
 from pybel.manager.citation_utils import enrich_pubmed_citations, get_citations_by_pmids, sanitize_date
 from pybel.manager.models import Citation
 from pybel.testing.cases import TemporaryCacheMixin
@@ -52,6 +54,104 @@ class TestSanitizeDate(unittest.TestCase):
         """Test failure."""
         self.assertEqual(None, sanitize_date('2012 Early Spring'))
 
+    def test_sanitize_invalid_month(self):
+        """Test failure on an unknown month or a day that is out of range for its month."""
+        self.assertEqual(None, sanitize_date('2012 Abc 19'))
+        self.assertEqual(None, sanitize_date('2012 Feb 30'))
+
+
+def _make_pubmed_record(pmid, authors):
+    """Make a dictionary like the one PubMed E-Utils returns for a single identifier."""
+    return {
+        'uid': pmid,
+        'title': 'Title {}'.format(pmid),
+        'fulljournalname': 'Journal of Tests',
+        'volume': '1',
+        'issue': '2',
+        'pages': '3-4',
+        'sortfirstauthor': authors[0],
+        'lastauthor': authors[-1],
+        'authors': [{'name': author, 'authtype': 'Author'} for author in authors],
+        'pubdate': '2012 Dec 19',
+    }
+
+
+class TestMockedCitations(unittest.TestCase):
+    """Tests for getting citations with a stubbed PubMed E-Utils response."""
+
+    def setUp(self):
+        """Set up an in-memory manager and the stubbed PubMed records."""
+        self.manager = self._make_manager()
+        self.records = {}
+        self.requested_groups = []
+
+    def tearDown(self):
+        """Close the manager's session."""
+        self.manager.session.close()
+
+    @staticmethod
+    def _make_manager() -> Manager:
+        manager = Manager(connection='sqlite://')
+        manager.create_all()
+        return manager
+
+    def _get_response(self, pubmed_identifiers, session=None):
+        """Stub :func:`pybel.manager.citation_utils.get_pubmed_citation_response` with the records."""
+        pubmed_identifiers = list(pubmed_identifiers)
+        self.requested_groups.append(pubmed_identifiers)
+        uids = [pmid for pmid in pubmed_identifiers if pmid in self.records]
+        result = {pmid: self.records[pmid] for pmid in uids}
+        result['uids'] = uids
+        return {'result': result}
+
+    def _get_citations(self, pmids, group_size=None):
+        with mock.patch('pybel.manager.citation_utils.get_pubmed_citation_response', side_effect=self._get_response):
+            return get_citations_by_pmids(self.manager, pmids=pmids, group_size=group_size, sleep_time=0)
+
+    def test_groups(self):
+        """Test that all groups are queried in order and the results are the same as querying one at a time."""
+        for pmid in '1235':
+            self.records[pmid] = _make_pubmed_record(pmid, ['Author A', 'Author B'])
+        self.records['3'] = {'uid': '3', 'error': 'cannot get document summary'}
+
+        result, errors = self._get_citations(['5', '4', '3', '2', '1'], group_size=2)
+
+        self.assertEqual([['1', '2'], ['3', '4'], ['5', None]], self.requested_groups)
+        self.assertEqual({'1', '2', '5'}, set(result))
+        self.assertEqual({'3', '4'}, errors, msg='both PubMed errors and missing identifiers should be errors')
+        for pmid in ('1', '2', '5'):
+            self.assertEqual('Journal of Tests', result[pmid][CITATION_JOURNAL])
+            self.assertEqual('2012-12-19', result[pmid][CITATION_DATE])
+
+        # Querying one at a time gives the same results
+        self.manager.session.close()
+        self.manager = self._make_manager()
+        self.requested_groups.clear()
+
+        serial_result, serial_errors = self._get_citations(['5', '4', '3', '2', '1'], group_size=1)
+        self.assertEqual([['1'], ['2'], ['3'], ['4'], ['5']], self.requested_groups)
+        self.assertEqual(result, serial_result)
+        self.assertEqual(errors, serial_errors)
+
+        # Enriched citations are looked up in the database instead of being queried again
+        self.requested_groups.clear()
+        cached_result, cached_errors = self._get_citations(['1', '2', '5'])
+        self.assertEqual([], self.requested_groups)
+        self.assertEqual(set(), cached_errors)
+        self.assertEqual(serial_result, cached_result)
+
+    def test_repeated_authors(self):
+        """Test that an author listed more than once is only added to the citation once, in first-seen order."""
+        self.records['1'] = _make_pubmed_record('1', ['Author C', 'Author A', 'Author C', 'Author B', 'Author A'])
+
+        result, errors = self._get_citations(['1'])
+        self.assertEqual(set(), errors)
+
+        citation = self.manager.get_citation_by_pmid('1')
+        self.assertIsNotNone(citation)
+        self.assertEqual(['Author C', 'Author A', 'Author B'], [author.name for author in citation.authors])
+        self.assertEqual(['Author A', 'Author B', 'Author C'], result['1'][CITATION_AUTHORS])
+
 
 class TestCitations(TemporaryCacheMixin):
     """Tests for citations."""
@@ -6,7 +6,7 @@ import unittest
 
 from pybel import BELGraph
 from pybel.dsl import pathology, protein
-from pybel.struct.filters.edge_predicates import has_pathology_causal
+from pybel.struct.filters.edge_predicates import has_pathology_causal, has_pubmed
 from pybel.testing.utils import n
 
 
@@ -30,3 +30,13 @@ class TestEdgePredicates(unittest.TestCase):
 
         key = graph.add_increases(a, c, citation=n(), evidence=n())
         self.assertFalse(has_pathology_causal(graph, a, c, key))
+
+    def test_missing_edge(self):
+        """Test that applying a predicate to an edge that isn't in the graph raises a key error."""
+        graph = BELGraph()
+        a, b = protein(n(), n()), protein(n(), n())
+        key = graph.add_increases(a, b, citation=n(), evidence=n())
+        self.assertTrue(has_pubmed(graph, a, b, key))
+
+        with self.assertRaises(KeyError):
+            has_pubmed(graph, b, a, key)
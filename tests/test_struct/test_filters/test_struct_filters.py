@@ -8,7 +8,7 @@ from pybel.constants import ANNOTATIONS
 from pybel.dsl import BaseEntity, Protein
 from pybel.struct.filters import (
     and_edge_predicates, concatenate_node_predicates, count_passed_edge_filter, count_passed_node_filter, filter_edges,
-    get_nodes, invert_edge_predicate,
+    filter_nodes, get_edges, get_nodes, invert_edge_predicate,
 )
 from pybel.struct.filters.edge_predicate_builders import (
     _annotation_dict_all_filter, _annotation_dict_any_filter, build_annotation_dict_all_filter,
@@ -46,6 +46,16 @@ class TestNodeFilters(unittest.TestCase):
         nodes = get_nodes(self.universe, [])
         self.assertEqual(self.all_universe_nodes, nodes)
 
+    def test_empty_node_filters(self):
+        """Test that an empty list or tuple of node predicates passes all nodes, in order."""
+        self.assertEqual(list(self.universe), list(filter_nodes(self.universe, [])))
+        self.assertEqual(list(self.universe), list(filter_nodes(self.universe, ())))
+
+    def test_none_node_filter(self):
+        """Test that giving None instead of node predicates is an error rather than passing all nodes."""
+        with self.assertRaises(TypeError):
+            list(filter_nodes(self.universe, None))
+
     def test_keep_node_permissive(self):
         nodes = get_nodes(self.universe, keep_node_permissive)
         self.assertEqual(self.all_universe_nodes, nodes)
@@ -74,6 +84,30 @@ class TestNodeFilters(unittest.TestCase):
         edges = make_edge_iterator_set(filter_edges(self.graph, []))
         self.assertEqual({(1, 2)}, edges)
 
+    def test_get_edges(self):
+        def starts_at_one(_, u, v, k) -> bool:
+            return u == 1
+
+        self.assertEqual({(1, 2), (1, 4), (1, 5)}, make_edge_iterator_set(get_edges(self.universe, starts_at_one)))
+        self.assertEqual(
+            list(filter_edges(self.universe, starts_at_one)),
+            get_edges(self.universe, starts_at_one),
+        )
+        self.assertEqual(list(self.universe.edges(keys=True)), get_edges(self.universe, []))
+
+        with self.assertRaises(TypeError):
+            get_edges(self.universe, None)
+
+    def test_empty_edge_filters(self):
+        """Test that an empty list or tuple of edge predicates passes all edges, in order."""
+        self.assertEqual(list(self.universe.edges(keys=True)), list(filter_edges(self.universe, [])))
+        self.assertEqual(list(self.universe.edges(keys=True)), list(filter_edges(self.universe, ())))
+
+    def test_none_edge_filter(self):
+        """Test that giving None instead of edge predicates is an error rather than passing all edges."""
+        with self.assertRaises(TypeError):
+            list(filter_edges(self.universe, None))
+
     def test_keep_edge_permissive(self):
         edges = make_edge_iterator_set(filter_edges(self.graph, keep_edge_permissive))
         self.assertEqual({(1, 2)}, edges)
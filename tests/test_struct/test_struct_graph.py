@@ -10,7 +10,7 @@ from io import StringIO
 import pybel
 import pybel.examples
 from pybel import BELGraph
-from pybel.constants import CITATION_DB, CITATION_IDENTIFIER, CITATION_TYPE_PUBMED
+from pybel.constants import CITATION_DB, CITATION_IDENTIFIER, CITATION_TYPE_PUBMED, PART_OF, RELATION
 from pybel.dsl import hgvs, protein
 from pybel.io.api import InvalidExtensionError
 from pybel.testing.utils import n
@@ -185,6 +185,22 @@ class TestGetGraphProperties(unittest.TestCase):
         annotations = self.graph.get_edge_annotations(test_source, test_target, key)
         self.assertIsNone(annotations)
 
+    def test_add_unqualified_edges(self):
+        """Test adding several unqualified edges at once."""
+        a, b, c = (protein(namespace='TEST', name=n()) for _ in range(3))
+
+        keys = self.graph.add_unqualified_edges([
+            (a, b, PART_OF),
+            (b, c, PART_OF),
+            (a, b, PART_OF),
+        ])
+
+        self.assertEqual(3, len(keys))
+        self.assertEqual(keys[0], keys[2])
+        self.assertEqual(keys[0], self.graph.add_part_of(a, b))
+        self.assertEqual(2, self.graph.number_of_edges())
+        self.assertEqual({RELATION: PART_OF}, self.graph[b][c][keys[1]])
+
     def test_add_node_with_variant(self):
         """Test that the identifier is carried through to the child."""
         graph = BELGraph()
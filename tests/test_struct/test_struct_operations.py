@@ -9,6 +9,7 @@ from pybel.dsl import protein
 from pybel.struct.operations import (
     left_full_join, left_node_intersection_join, left_outer_join, node_intersection, union,
 )
+from pybel.struct.utils import update_node_helper
 from pybel.testing.utils import n
 
 p1, p2, p3, p4, p5, p6, p7, p8 = (protein(namespace='HGNC', name=n()) for _ in range(8))
@@ -81,6 +82,22 @@ class TestLeftFullJoin(unittest.TestCase):
         for node in p1, p2, p3, p4, p5:
             self.assertIn(node, a)
 
+    def test_full_join_node_order(self):
+        """Test that nodes keep their order and data from h, even when an edge points to a later node."""
+        a = BELGraph()
+        b = BELGraph()
+        b.add_node_from_data(p1)
+        b.add_node_from_data(p2)
+        b.add_node_from_data(p3)
+        b.nodes[p3][self.tag] = self.tag_value
+        b.add_increases(p1, p3, citation=n(), evidence=n())
+
+        left_full_join(a, b)
+
+        self.assertEqual([p1, p2, p3], list(a))
+        self.assertEqual(self.tag_value, a.nodes[p3][self.tag])
+        self.assertEqual(1, a.number_of_edges())
+
     def test_in_place_operator_failure(self):
         """Test that using the wrong type with the in-place addition operator raises an error."""
         with self.assertRaises(TypeError):
@@ -264,5 +281,35 @@ class TestInnerJoin(unittest.TestCase):
         self.assertEqual(self.g, res)
 
 
+class TestUpdateNodeHelper(unittest.TestCase):
+    """Tests for copying node data between graphs."""
+
+    def _help_test_update(self, source: BELGraph, target: BELGraph) -> None:
+        source.nodes[p1]['tag'] = 'value'
+        update_node_helper(source, target)
+        self.assertEqual('value', target.nodes[p1]['tag'])
+        self.assertNotIn('tag', target.nodes[p2])
+        self.assertNotIn(p3, target)
+
+    def test_small_target(self):
+        """Test updating a target graph that is smaller than the source graph."""
+        source = BELGraph()
+        source.add_increases(p1, p2, citation=n(), evidence=n())
+        source.add_increases(p1, p3, citation=n(), evidence=n())
+        target = BELGraph()
+        target.add_increases(p1, p2, citation=n(), evidence=n())
+        self._help_test_update(source, target)
+
+    def test_small_source(self):
+        """Test updating a target graph that is larger than the source graph."""
+        source = BELGraph()
+        source.add_increases(p1, p3, citation=n(), evidence=n())
+        target = BELGraph()
+        target.add_increases(p1, p2, citation=n(), evidence=n())
+        target.add_increases(p2, p4, citation=n(), evidence=n())
+        target.add_increases(p4, p5, citation=n(), evidence=n())
+        self._help_test_update(source, target)
+
+
 if __name__ == '__main__':
     unittest.main()
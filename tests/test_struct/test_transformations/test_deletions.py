@@ -8,8 +8,8 @@ from pybel import BELGraph
 from pybel.constants import POSITIVE_CORRELATION, RELATION
 from pybel.dsl import CompositeAbundance, Protein, gene, hgvs, pathology, protein_fusion, rna, rna_fusion
 from pybel.struct.mutation import (
-    enrich_protein_and_rna_origins, prune_protein_rna_origins, remove_associations, remove_isolated_list_abundances,
-    remove_pathologies,
+    enrich_protein_and_rna_origins, prune_protein_rna_origins, remove_associations, remove_filtered_edges,
+    remove_isolated_list_abundances, remove_pathologies,
 )
 from pybel.struct.mutation.utils import remove_isolated_nodes, remove_isolated_nodes_op
 from pybel.testing.utils import n
@@ -59,6 +59,16 @@ class TestDeletions(unittest.TestCase):
         self.assertEqual(3, g.number_of_nodes())
         self.assertEqual(2, g.number_of_edges())
 
+    def test_remove_filtered_edges_without_predicates(self):
+        """Test that removing filtered edges without any predicates fails instead of removing all edges."""
+        g = BELGraph()
+        g.add_edge(1, 2)
+
+        with self.assertRaises(TypeError):
+            remove_filtered_edges(g)
+
+        self.assertEqual(1, g.number_of_edges())
+
     def test_remove_isolated_in_place(self):
         """Test removing isolated nodes (in-place)."""
         g = BELGraph()